@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sqlite3
-import time
+import itertools
+import functools
 from datetime import datetime
 
 # --- 1. CONFIGURATION & DATABASE SETUP (Unchanged) ---
@@ -15,64 +16,222 @@ RATE_PLANS = {
 }
 # Default rate when rate_plan is not implemented for cost calculation
 DEFAULT_RATE_PER_SECOND = RATE_PLANS["Standard"]
+# Plan names for the rate dropdown, and the plan preselected in it
+RATE_PLAN_NAMES = tuple(RATE_PLANS)
+DEFAULT_RATE_PLAN = RATE_PLAN_NAMES[0]
+
+# Upper bound on bound parameters per statement (SQLite's historical limit is 999)
+MAX_SQL_PARAMS = 900
+
+# Rows inserted into the customer Treeview per idle callback
+TREEVIEW_BATCH_SIZE = 200
+
+# Base tables, compiled in one executescript call by create_database
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS Customers (
+        customer_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        phone_number TEXT UNIQUE NOT NULL,
+        name TEXT NOT NULL,
+        address TEXT,
+        rate_plan TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS CallLogs (
+        call_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        customer_id INTEGER,
+        callee_number TEXT,
+        start_time TEXT,
+        duration_seconds INTEGER,
+        cost REAL,
+        FOREIGN KEY (customer_id) REFERENCES Customers(customer_id) ON DELETE CASCADE
+    );
+
+    CREATE TABLE IF NOT EXISTS BillHistory (
+        bill_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        customer_id INTEGER NOT NULL,
+        billing_period TEXT NOT NULL,
+        total_calls INTEGER,
+        total_charge REAL,
+        date_generated TEXT,
+        FOREIGN KEY (customer_id) REFERENCES Customers(customer_id) ON DELETE CASCADE
+    );
+"""
+
+# Running per-period totals kept up to date by log_calls_bulk so that
+# generate_bill does not have to aggregate CallLogs.
+CREATE_MONTHLY_TOTALS_SQL = """
+    CREATE TABLE MonthlyTotals (
+        customer_id INTEGER NOT NULL,
+        period TEXT NOT NULL,
+        total_calls INTEGER NOT NULL,
+        total_charge REAL NOT NULL,
+        PRIMARY KEY (customer_id, period),
+        FOREIGN KEY (customer_id) REFERENCES Customers(customer_id) ON DELETE CASCADE
+    )
+"""
+
+# Seeds MonthlyTotals from calls logged before the table existed
+BACKFILL_MONTHLY_TOTALS_SQL = """
+    INSERT INTO MonthlyTotals (customer_id, period, total_calls, total_charge)
+    SELECT customer_id, substr(start_time, 1, 7), COUNT(call_id), SUM(cost)
+    FROM CallLogs
+    WHERE customer_id IN (SELECT customer_id FROM Customers)
+    GROUP BY customer_id, substr(start_time, 1, 7)
+"""
+
+# Index for per-customer call lookups
+CREATE_CALLLOGS_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_calllogs_cust_time
+    ON CallLogs (customer_id, start_time)
+"""
+
+# Older versions could store duplicate bills for a customer and period. Their
+# recalculations always updated the lowest bill_id, so keep that row and drop
+# the stale copies before the unique index below is built.
+DEDUPE_BILLS_SQL = """
+    DELETE FROM BillHistory
+    WHERE bill_id NOT IN (
+        SELECT MIN(bill_id) FROM BillHistory GROUP BY customer_id, billing_period
+    )
+"""
+
+# Guarantees at most one bill per customer and period (required by UPSERT_BILL_SQL)
+CREATE_BILL_INDEX_SQL = """
+    CREATE UNIQUE INDEX idx_billhist_cust_period
+    ON BillHistory (customer_id, billing_period)
+"""
+
+def _schema_object_exists(conn, name):
+    """Returns True if a table or index called `name` exists."""
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone() is not None
 
 def create_database():
     """Initializes the SQLite database and creates necessary tables."""
+    conn = None
     try:
         conn = sqlite3.connect(DB_NAME)
         conn.execute("PRAGMA foreign_keys = ON") 
-        cursor = conn.cursor()
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Customers (
-                customer_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                phone_number TEXT UNIQUE NOT NULL,
-                name TEXT NOT NULL,
-                address TEXT,
-                rate_plan TEXT
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS CallLogs (
-                call_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                customer_id INTEGER,
-                callee_number TEXT,
-                start_time TEXT,
-                duration_seconds INTEGER,
-                cost REAL,
-                FOREIGN KEY (customer_id) REFERENCES Customers(customer_id) ON DELETE CASCADE
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS BillHistory (
-                bill_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                customer_id INTEGER NOT NULL,
-                billing_period TEXT NOT NULL,
-                total_calls INTEGER,
-                total_charge REAL,
-                date_generated TEXT,
-                FOREIGN KEY (customer_id) REFERENCES Customers(customer_id) ON DELETE CASCADE
-            )
-        """)
-        
-        conn.commit()
+        conn.executescript(SCHEMA_SQL)
+        
+        if not _schema_object_exists(conn, 'MonthlyTotals'):
+            # Create and backfill in one transaction, so a failure leaves no
+            # empty table behind and the backfill is retried on next launch
+            conn.execute("BEGIN")
+            conn.execute(CREATE_MONTHLY_TOTALS_SQL)
+            conn.execute(BACKFILL_MONTHLY_TOTALS_SQL)
+            conn.commit()
+        
+        conn.execute(CREATE_CALLLOGS_INDEX_SQL)
+        
+        if not _schema_object_exists(conn, 'idx_billhist_cust_period'):
+            conn.execute("BEGIN")
+            conn.execute(DEDUPE_BILLS_SQL)
+            conn.execute(CREATE_BILL_INDEX_SQL)
+            conn.commit()
     except Exception as e:
+        if conn:
+            conn.rollback()
         messagebox.showerror("DB Error", f"Failed to initialize database: {e}")
     finally:
         if conn:
             conn.close()
 
+# Shared connection reused by every data access function (see open_connection)
+_CONN = None
+
+# Prepared statements kept per connection; the fixed queries below always hit it
+STATEMENT_CACHE_SIZE = 256
+
+# Per-connection tuning: WAL journaling avoids an fsync per commit
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA mmap_size = 268435456",
+)
+
+def open_connection():
+    """Returns the shared SQLite connection, opening it on first use."""
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_NAME, check_same_thread=False,
+                                cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma in CONNECTION_PRAGMAS:
+            _CONN.execute(pragma)
+    return _CONN
+
+def close_connection():
+    """Closes the shared SQLite connection if it is open."""
+    global _CONN
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
+
 # --- 2. BUSINESS LOGIC & DATA ACCESS FUNCTIONS (Unchanged) ---
 
+# Fixed SQL text, defined once so every call reuses the cached prepared statement
+SELECT_ALL_CUSTOMERS_SQL = "SELECT customer_id, phone_number, name, address, rate_plan FROM Customers ORDER BY customer_id DESC"
+INSERT_CUSTOMER_SQL = "INSERT INTO Customers (phone_number, name, address, rate_plan) VALUES (?, ?, ?, ?)"
+UPDATE_CUSTOMER_SQL = """
+    UPDATE Customers 
+    SET phone_number = ?, name = ?, address = ?, rate_plan = ? 
+    WHERE customer_id = ?
+"""
+DELETE_CUSTOMER_SQL = "DELETE FROM Customers WHERE customer_id = ?"
+UPSERT_MONTHLY_TOTALS_SQL = """
+    INSERT INTO MonthlyTotals (customer_id, period, total_calls, total_charge)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (customer_id, period) DO UPDATE SET
+        total_calls = total_calls + excluded.total_calls,
+        total_charge = total_charge + excluded.total_charge
+"""
+SELECT_MONTHLY_TOTALS_SQL = """
+    SELECT total_charge, total_calls
+    FROM MonthlyTotals 
+    WHERE customer_id = ? AND period = ?
+"""
+UPSERT_BILL_SQL = """
+    INSERT INTO BillHistory (customer_id, billing_period, total_calls, total_charge, date_generated)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (customer_id, billing_period) DO UPDATE SET
+        total_calls = excluded.total_calls,
+        total_charge = excluded.total_charge,
+        date_generated = excluded.date_generated
+"""
+SELECT_CUSTOMER_BILLS_SQL = """
+    SELECT bill_id, billing_period, total_calls, total_charge, date_generated 
+    FROM BillHistory 
+    WHERE customer_id = ? 
+    ORDER BY billing_period DESC
+"""
+
+@functools.lru_cache(maxsize=None)
+def _select_customers_by_phone_sql(count):
+    """Returns the caller lookup for `count` phone numbers, built once per size."""
+    placeholders = ",".join("?" * count)
+    return f"""
+        SELECT phone_number, customer_id, rate_plan FROM Customers
+        WHERE phone_number IN ({placeholders})
+    """
+
+@functools.lru_cache(maxsize=None)
+def _insert_calls_sql(count):
+    """Returns the multi-row CallLogs insert for `count` rows, built once per size."""
+    values = ",".join(["(?, ?, ?, ?, ?)"] * count)
+    return f"""
+        INSERT INTO CallLogs (customer_id, callee_number, start_time, duration_seconds, cost)
+        VALUES {values}
+    """
+
 def execute_query(query, params=(), fetch_mode=None):
     """Helper function to handle all database operations."""
     conn = None
     result = None
     try:
-        conn = sqlite3.connect(DB_NAME)
-        conn.execute("PRAGMA foreign_keys = ON")
+        conn = open_connection()
         cursor = conn.cursor()
         cursor.execute(query, params)
         
@@ -80,6 +239,9 @@ def execute_query(query, params=(), fetch_mode=None):
             result = cursor.fetchall()
         elif fetch_mode == 'one':
             result = cursor.fetchone()
+        elif fetch_mode == 'lastrowid':
+            conn.commit()
+            result = cursor.lastrowid
         else:
             conn.commit()
             result = True
@@ -87,118 +249,136 @@ def execute_query(query, params=(), fetch_mode=None):
         return result
         
     except sqlite3.IntegrityError:
+        if conn:
+            conn.rollback()
         messagebox.showerror("Error", "A record with this unique value already exists (e.g., phone number).")
         return None if fetch_mode else False
     except Exception as e:
+        if conn:
+            conn.rollback()
         messagebox.showerror("DB Error", f"Database operation failed: {e}")
         return None if fetch_mode else False
-    finally:
-        if conn:
-            conn.close()
 
 def get_all_customers():
-    query = "SELECT customer_id, phone_number, name, address, rate_plan FROM Customers ORDER BY customer_id DESC"
-    customers = execute_query(query, fetch_mode='all')
+    customers = execute_query(SELECT_ALL_CUSTOMERS_SQL, fetch_mode='all')
     return customers if customers is not None else []
 
 def add_customer(phone, name, address, rate_plan):
-    query = "INSERT INTO Customers (phone_number, name, address, rate_plan) VALUES (?, ?, ?, ?)"
-    if execute_query(query, (phone, name, address, rate_plan)):
+    """Inserts a customer and returns the new customer_id, or False on failure."""
+    customer_id = execute_query(INSERT_CUSTOMER_SQL, (phone, name, address, rate_plan), fetch_mode='lastrowid')
+    if customer_id:
         messagebox.showinfo("Success", f"Customer {name} added successfully.")
-        return True
+        return customer_id
     return False
 
 def update_customer(customer_id, phone, name, address, rate_plan):
-    query = """
-        UPDATE Customers 
-        SET phone_number = ?, name = ?, address = ?, rate_plan = ? 
-        WHERE customer_id = ?
-    """
     params = (phone, name, address, rate_plan, customer_id)
-    if execute_query(query, params):
+    if execute_query(UPDATE_CUSTOMER_SQL, params):
         messagebox.showinfo("Success", f"Customer ID {customer_id} updated successfully.")
         return True
     return False
 
 def delete_customer(customer_id):
-    query = "DELETE FROM Customers WHERE customer_id = ?"
-    if execute_query(query, (customer_id,)):
+    if execute_query(DELETE_CUSTOMER_SQL, (customer_id,)):
         messagebox.showinfo("Deleted", f"Customer ID {customer_id} and all related records have been deleted.")
         return True
     return False
 
-def log_call(phone_number, callee_number, duration_seconds):
-    customer_data = execute_query("SELECT customer_id, rate_plan FROM Customers WHERE phone_number = ?", 
-                             (phone_number,), fetch_mode='one')
-    
-    if not customer_data:
-        messagebox.showerror("Error", f"Customer with phone number {phone_number} not found.")
-        return False
-        
-    customer_id, rate_plan_name = customer_data
-    rate = RATE_PLANS.get(rate_plan_name, DEFAULT_RATE_PER_SECOND) 
-    call_cost = duration_seconds * rate
-    start_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    query = """
-        INSERT INTO CallLogs (customer_id, callee_number, start_time, duration_seconds, cost) 
-        VALUES (?, ?, ?, ?, ?)
+def _chunked(items, size):
+    """Yields consecutive slices of at most `size` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def log_calls_bulk(calls):
     """
-    params = (customer_id, callee_number, start_time, duration_seconds, call_cost)
-    
-    if execute_query(query, params):
-        messagebox.showinfo("Call Logged", 
-                            f"Call logged for {phone_number} (Rate: {rate_plan_name}).\nDuration: {duration_seconds}s, Cost: ${call_cost:.2f}")
-        return True
-    return False
+    Logs many calls in a single transaction.
+    Each call is a (phone_number, callee_number, duration_seconds) tuple.
+    Returns a list of (rate_plan_name, call_cost) per call, or None on failure.
+    """
+    calls = list(calls)
+    if not calls:
+        return []
 
-def generate_bill(customer_id, billing_period):
-    period_filter = f"{billing_period}%"
+    conn = open_connection()
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
+        # 1. Resolve every distinct caller with one IN (...) lookup per chunk
+        phones = list(dict.fromkeys(phone for phone, _, _ in calls))
+        customers = {}
+        for chunk in _chunked(phones, MAX_SQL_PARAMS):
+            cursor = conn.execute(_select_customers_by_phone_sql(len(chunk)), chunk)
+            for phone, customer_id, rate_plan_name in cursor:
+                customers[phone] = (customer_id, rate_plan_name)
+
+        missing = [phone for phone in phones if phone not in customers]
+        if missing:
+            messagebox.showerror("Error", f"Customer with phone number {', '.join(missing)} not found.")
+            return None
+
+        # 2. Price every call in Python and accumulate per-customer totals;
+        # one timestamp is taken for the whole batch
+        start_time = datetime.now().isoformat(sep=' ', timespec='seconds')
+        period = start_time[:7]
+        rows = []
+        logged = []
+        totals = {}
+        for phone, callee_number, duration_seconds in calls:
+            customer_id, rate_plan_name = customers[phone]
+            call_cost = duration_seconds * RATE_PLANS.get(rate_plan_name, DEFAULT_RATE_PER_SECOND)
+            rows.append((customer_id, callee_number, start_time, duration_seconds, call_cost))
+            logged.append((rate_plan_name, call_cost))
+            total_calls, total_charge = totals.get(customer_id, (0, 0.0))
+            totals[customer_id] = (total_calls + 1, total_charge + call_cost)
+
+        # 3. Insert all rows under one commit, many rows per INSERT statement
+        rows_per_insert = MAX_SQL_PARAMS // len(rows[0])
+        with conn:
+            for chunk in _chunked(rows, rows_per_insert):
+                conn.execute(_insert_calls_sql(len(chunk)), list(itertools.chain.from_iterable(chunk)))
+            conn.executemany(UPSERT_MONTHLY_TOTALS_SQL, [(customer_id, period, total_calls, total_charge)
+                  for customer_id, (total_calls, total_charge) in totals.items()])
+        return logged
 
-        cursor.execute("""
-            SELECT SUM(cost), COUNT(call_id)
-            FROM CallLogs 
-            WHERE customer_id = ? AND start_time LIKE ? 
-        """, (customer_id, period_filter))
-        
-        result = cursor.fetchone()
-        
-        total_charge, total_calls = result if result else (None, None)
-        
-        if total_calls is None or total_calls == 0:
-            messagebox.showinfo("Info", "No calls found for this period to generate a bill.")
-            return
+    except Exception as e:
+        messagebox.showerror("DB Error", f"Database operation failed: {e}")
+        return None
 
-        date_generated = time.strftime("%Y-%m-%d %H:%M:%S")
+def log_call(phone_number, callee_number, duration_seconds):
+    logged = log_calls_bulk([(phone_number, callee_number, duration_seconds)])
+    if not logged:
+        return False
 
-        exists = cursor.execute("SELECT bill_id FROM BillHistory WHERE customer_id = ? AND billing_period = ?",
-                                (customer_id, billing_period)).fetchone()
-        
-        if exists:
-            query = """
-                UPDATE BillHistory SET total_calls = ?, total_charge = ?, date_generated = ?
-                WHERE bill_id = ?
-            """
-            cursor.execute(query, (total_calls, total_charge, date_generated, exists[0]))
-            conn.commit()
-            messagebox.showinfo("Bill Updated", f"Bill for period {billing_period} updated.\nTotal Charge: ${total_charge:.2f}")
-        else:
-            query = """
-                INSERT INTO BillHistory (customer_id, billing_period, total_calls, total_charge, date_generated)
-                VALUES (?, ?, ?, ?, ?)
-            """
-            cursor.execute(query, (customer_id, billing_period, total_calls, total_charge, date_generated))
-            conn.commit()
-            messagebox.showinfo("Bill Generated", f"Bill for period {billing_period} generated.\nTotal Charge: ${total_charge:.2f}")
+    rate_plan_name, call_cost = logged[0]
+    messagebox.showinfo("Call Logged", 
+                        f"Call logged for {phone_number} (Rate: {rate_plan_name}).\nDuration: {duration_seconds}s, Cost: ${call_cost:.2f}")
+    return True
+
+def generate_bill(customer_id, billing_period):
+    try:
+        conn = open_connection()
+        # One IMMEDIATE transaction covers the totals read and the bill write;
+        # dialogs are only shown after it commits so the write lock is not held.
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+
+            cursor.execute(SELECT_MONTHLY_TOTALS_SQL, (customer_id, billing_period))
+            
+            result = cursor.fetchone()
+            
+            total_charge, total_calls = result if result else (None, None)
+            
+            if total_calls:
+                date_generated = datetime.now().isoformat(sep=' ', timespec='seconds')
+                cursor.execute(UPSERT_BILL_SQL, (customer_id, billing_period, total_calls, total_charge, date_generated))
 
     except Exception as e:
         messagebox.showerror("Error", f"Failed to generate bill: {e}")
-    finally:
-        if conn:
-            conn.close()
+        return
+
+    if total_calls is None or total_calls == 0:
+        messagebox.showinfo("Info", "No calls found for this period to generate a bill.")
+    else:
+        messagebox.showinfo("Bill Generated", f"Bill for period {billing_period} generated.\nTotal Charge: ${total_charge:.2f}")
 
 # --- 3. TKINTER GUI (Presentation Layer) ---
 
@@ -209,36 +389,65 @@ class BillingApp:
         master.geometry("1000x700")
         
         create_database()
+        open_connection()
+        master.protocol("WM_DELETE_WINDOW", self.handle_close)
 
         self.selected_customer_id = tk.IntVar()
         self.selected_customer_id.set(0)
         self.customer_phone_map = {}
+        self.customer_options = [] # Dropdown display names, newest customer first
+        self.customer_display_names = {} # customer_id -> display name in customer_phone_map
+        self._customers_cache = None # Customer rows shared by the treeview and dropdowns
+        self._tree_fill_job = None # Pending after_idle batch of the customer Treeview
+        self._refresh_pending = False # Coalesces schedule_refresh calls into one redraw
 
         self.rate_plan_var = tk.StringVar(master)
-        self.rate_plan_var.set(list(RATE_PLANS.keys())[0])
+        self.rate_plan_var.set(DEFAULT_RATE_PLAN)
         
         self.notebook = ttk.Notebook(master)
         self.notebook.pack(pady=10, padx=10, expand=True, fill="both")
         
+        # Call Log and Billing tabs start as empty frames and are built on first view
         self.customer_tab = ttk.Frame(self.notebook)
         self.call_log_tab = ttk.Frame(self.notebook)
         self.billing_tab = ttk.Frame(self.notebook)
+        self._call_log_tab_built = False
+        self._billing_tab_built = False
 
         self.notebook.add(self.customer_tab, text="👤 Customer Management (CRUD)")
         self.notebook.add(self.call_log_tab, text="☎️ Call Logging")
         self.notebook.add(self.billing_tab, text="💰 Bill Generation & View")
         
-        # --- TIMER INITIALIZATION ---
-        self.timer = None # Tracks the pending single-click action
-        # ----------------------------
-        
         self.setup_customer_tab()
-        self.setup_call_log_tab()
-        self.setup_billing_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self.handle_tab_changed)
         
         self.load_customers_to_treeview()
         self.update_customer_dropdowns()
 
+    def handle_tab_changed(self, event):
+        """Builds the Call Log and Billing tabs the first time each one is shown."""
+        current = self.notebook.index('current')
+
+        if current == self.notebook.index(self.call_log_tab) and not self._call_log_tab_built:
+            self._call_log_tab_built = True
+            self.setup_call_log_tab()
+            self.refresh_customer_dropdowns()
+        elif current == self.notebook.index(self.billing_tab) and not self._billing_tab_built:
+            self._billing_tab_built = True
+            self.setup_billing_tab()
+            self.refresh_customer_dropdowns()
+
+    def handle_close(self):
+        """Closes the shared database connection before destroying the window."""
+        close_connection()
+        self.master.destroy()
+
+    def get_all_customers_cached(self):
+        """Returns the customer list, querying the database only after invalidation."""
+        if self._customers_cache is None:
+            self._customers_cache = get_all_customers()
+        return self._customers_cache
+
     # --- Customer Tab UI ---
     def setup_customer_tab(self):
         # ... [Input fields and buttons setup remains the same] ...
@@ -264,7 +473,7 @@ class BillingApp:
         
         tk.Label(input_box, text="Rate Plan:").grid(row=3, column=0, padx=5, pady=2, sticky='w')
         self.rate_combo = ttk.Combobox(input_box, textvariable=self.rate_plan_var, 
-                                       values=list(RATE_PLANS.keys()), state='readonly', width=38)
+                                       values=RATE_PLAN_NAMES, state='readonly', width=38)
         self.rate_combo.grid(row=3, column=1, padx=5, pady=2, sticky='we')
         
         input_box.grid_columnconfigure(1, weight=1)
@@ -315,21 +524,16 @@ class BillingApp:
         self.customer_tree.pack(side=tk.LEFT, fill="both", expand=True)
         scrollbar.pack(side='right', fill='y')
 
-        # FINAL ROBUST BINDINGS:
-        # 1. Selection change (single click) starts the timer
+        # BINDINGS:
+        # 1. Selection change (single click) switches straight to Delete mode
         self.customer_tree.bind('<<TreeviewSelect>>', self.handle_treeview_select)
-        # 2. Double click cancels the timer and runs update logic
+        # 2. Double click arrives after the selection event and switches to Update mode
         self.customer_tree.bind('<Double-1>', self.handle_double_click_update)
 
 
     def clear_customer_entries(self):
         """Clears inputs and resets buttons to 'Add' mode."""
         
-        # Cancel the pending timer if it exists
-        if self.timer:
-            self.master.after_cancel(self.timer)
-            self.timer = None
-            
         # 1. Clear customer ID state
         self.selected_customer_id.set(0)
         
@@ -338,7 +542,7 @@ class BillingApp:
         self.phone_entry.delete(0, tk.END)
         self.name_entry.delete(0, tk.END)
         self.address_entry.delete(0, tk.END)
-        self.rate_plan_var.set(list(RATE_PLANS.keys())[0])
+        self.rate_plan_var.set(DEFAULT_RATE_PLAN)
         
         # 3. Reset buttons
         self.update_btn.config(state=tk.DISABLED)
@@ -349,10 +553,11 @@ class BillingApp:
         if self.customer_tree.selection():
             self.customer_tree.selection_remove(self.customer_tree.selection())
 
-    def execute_single_click_delete(self):
+    def handle_treeview_select(self, event):
         """
-        Action performed when the single-click timer expires. 
-        Sets buttons to Delete Mode.
+        On selection, immediately sets buttons to Delete Mode.
+        Tk delivers <<TreeviewSelect>> before <Double-1>, so a double-click
+        then moves on to Update Mode without any timer.
         """
         selected_items = self.customer_tree.selection()
         
@@ -370,44 +575,17 @@ class BillingApp:
             self.phone_entry.delete(0, tk.END)
             self.name_entry.delete(0, tk.END)
             self.address_entry.delete(0, tk.END)
-            self.rate_plan_var.set(list(RATE_PLANS.keys())[0])
+            self.rate_plan_var.set(DEFAULT_RATE_PLAN)
 
             # 2. Set button states to Delete mode
             self.update_btn.config(state=tk.DISABLED)
             self.delete_btn.config(state=tk.NORMAL) 
             self.add_btn.config(state=tk.NORMAL)
-        
-        self.timer = None # Clear timer reference
-
-    def handle_treeview_select(self, event):
-        """
-        On selection, cancel any existing timer and start a new one.
-        If a double-click happens, it will cancel this new timer.
-        """
-        selected_items = self.customer_tree.selection()
-
-        if not selected_items:
-            self.clear_customer_entries()
-            return
-
-        # 1. Cancel any previous pending action
-        if self.timer:
-            self.master.after_cancel(self.timer)
-        
-        # 2. Set a new timer for the single-click action (250ms is standard)
-        self.timer = self.master.after(250, self.execute_single_click_delete)
-        
-        # return "break" is NOT used here, as we want the Treeview selection to proceed normally.
 
     def handle_double_click_update(self, event):
         """
-        Handles the double-click. Cancels the timer and executes Update logic.
+        Handles the double-click and executes Update logic.
         """
-        # CRITICAL: Cancel the single-click timer immediately
-        if self.timer:
-            self.master.after_cancel(self.timer)
-            self.timer = None
-        
         # Get the item clicked
         selected_item = self.customer_tree.identify_row(event.y)
 
@@ -440,8 +618,8 @@ class BillingApp:
             self.delete_btn.config(state=tk.NORMAL) 
             self.add_btn.config(state=tk.DISABLED)
             
-            # Return "break" to stop the double-click event from generating any further 
-            # single-click behavior (though the timer cancellation is the main fix).
+            # Return "break" so the Treeview class double-click binding, which
+            # toggles the row's open state, does not also run.
             return "break"
 
 
@@ -454,10 +632,12 @@ class BillingApp:
         rate = self.rate_plan_var.get()
 
         if phone and name and rate in RATE_PLANS:
-            if add_customer(phone, name, address, rate):
+            new_id = add_customer(phone, name, address, rate)
+            if new_id:
+                self._customers_cache = None
                 self.clear_customer_entries()
-                self.load_customers_to_treeview()
-                self.update_customer_dropdowns()  
+                self.add_customer_option(new_id, phone, name)
+                self.schedule_refresh()
         else:
             messagebox.showwarning("Input Error", "Phone Number, Name, and a valid Rate Plan are required.")
             
@@ -478,9 +658,10 @@ class BillingApp:
             self.phone_entry.config(state=tk.NORMAL) 
             
             if update_customer(cust_id, phone, name, address, rate):
+                self._customers_cache = None
                 self.clear_customer_entries()
-                self.load_customers_to_treeview()
-                self.update_customer_dropdowns()
+                self.replace_customer_option(cust_id, phone, name)
+                self.schedule_refresh()
             else:
                 self.phone_entry.config(state=tk.DISABLED)
                 messagebox.showerror("Update Failed", "The customer update could not be completed.")
@@ -507,9 +688,10 @@ class BillingApp:
             if confirm:
                 self.phone_entry.config(state=tk.NORMAL) 
                 if delete_customer(cust_id):
+                    self._customers_cache = None
                     self.clear_customer_entries()
-                    self.load_customers_to_treeview()
-                    self.update_customer_dropdowns()
+                    self.remove_customer_option(cust_id)
+                    self.schedule_refresh()
                 else:
                     messagebox.showerror("Deletion Failed", "The customer deletion could not be completed.")
                     self.phone_entry.config(state=tk.DISABLED)
@@ -517,27 +699,99 @@ class BillingApp:
             messagebox.showwarning("Error", "No customer selected for deletion.")
 
 
+    def schedule_refresh(self):
+        """Queues one Treeview and dropdown redraw for when Tk is idle."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.master.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self.load_customers_to_treeview()
+        self.refresh_customer_dropdowns()
+
     def load_customers_to_treeview(self):
         if self.customer_tree.selection():
              self.customer_tree.selection_remove(self.customer_tree.selection())
 
-        for item in self.customer_tree.get_children():
-            self.customer_tree.delete(item)
+        # Drop any batch still queued from a previous refresh
+        if self._tree_fill_job:
+            self.master.after_cancel(self._tree_fill_job)
+            self._tree_fill_job = None
+
+        self.customer_tree.delete(*self.customer_tree.get_children())
             
-        customers = get_all_customers()
-        
-        for customer_record in customers:
+        customers = self.get_all_customers_cached()
+        self._insert_customer_rows(customers, 0)
+
+    def _insert_customer_rows(self, customers, start):
+        """Inserts one batch of customer rows and queues the next one with after_idle."""
+        self._tree_fill_job = None
+        end = start + TREEVIEW_BATCH_SIZE
+
+        # Hide the columns while inserting so Tk lays them out once per batch
+        self.customer_tree.configure(displaycolumns=())
+        for customer_record in customers[start:end]:
             self.customer_tree.insert('', tk.END, values=customer_record)
+        self.customer_tree.configure(displaycolumns='#all')
+
+        if end < len(customers):
+            self._tree_fill_job = self.master.after_idle(self._insert_customer_rows, customers, end)
     
     # --- Dropdown, Call Log, and Billing Functions (Omitted for brevity, assumed stable) ---
     def update_customer_dropdowns(self):
-        customers = get_all_customers()
-        customer_options = []
+        """Rebuilds the dropdown options from the full customer list (startup only)."""
+        customers = self.get_all_customers_cached()
+        self.customer_options = []
         self.customer_phone_map = {}
+        self.customer_display_names = {}
         for cust_id, phone, name, _, _ in customers: 
             display_name = f"{name} ({phone})"
-            customer_options.append(display_name)
+            self.customer_options.append(display_name)
             self.customer_phone_map[display_name] = {'id': cust_id, 'phone': phone}
+            self.customer_display_names[cust_id] = display_name
+
+        self.refresh_customer_dropdowns()
+
+    def add_customer_option(self, cust_id, phone, name):
+        """Records one new customer in the dropdown maps without rebuilding them."""
+        display_name = f"{name} ({phone})"
+        # Newest first, matching the ORDER BY customer_id DESC of get_all_customers
+        self.customer_options.insert(0, display_name)
+        self.customer_phone_map[display_name] = {'id': cust_id, 'phone': phone}
+        self.customer_display_names[cust_id] = display_name
+
+    def replace_customer_option(self, cust_id, phone, name):
+        """Renames one customer's dropdown entry in the maps in place."""
+        old_display_name = self.customer_display_names.get(cust_id)
+        if old_display_name is None:
+            self.update_customer_dropdowns()
+            return
+
+        display_name = f"{name} ({phone})"
+        self.customer_options[self.customer_options.index(old_display_name)] = display_name
+        del self.customer_phone_map[old_display_name]
+        self.customer_phone_map[display_name] = {'id': cust_id, 'phone': phone}
+        self.customer_display_names[cust_id] = display_name
+
+        # Keep a current selection of the renamed customer pointing at it
+        for var_name in ('call_customer_var', 'bill_customer_var'):
+            var = getattr(self, var_name, None)
+            if var is not None and var.get() == old_display_name:
+                var.set(display_name)
+
+    def remove_customer_option(self, cust_id):
+        """Drops one deleted customer from the dropdown maps."""
+        display_name = self.customer_display_names.pop(cust_id, None)
+        if display_name is None:
+            return
+
+        del self.customer_phone_map[display_name]
+        self.customer_options.remove(display_name)
+
+    def refresh_customer_dropdowns(self):
+        """Pushes customer_options to the dropdowns, keeping still-valid selections."""
+        customer_options = self.customer_options
 
         if hasattr(self, 'call_customer_dropdown'):
             self.call_customer_dropdown['values'] = customer_options
@@ -688,13 +942,7 @@ class BillingApp:
         if not customer_id:
             return
 
-        query = """
-            SELECT bill_id, billing_period, total_calls, total_charge, date_generated 
-            FROM BillHistory 
-            WHERE customer_id = ? 
-            ORDER BY billing_period DESC
-        """
-        bills = execute_query(query, (customer_id,), fetch_mode='all')
+        bills = execute_query(SELECT_CUSTOMER_BILLS_SQL, (customer_id,), fetch_mode='all')
         
         if bills is None:
              return